@@ -14,6 +14,7 @@
 """Auxiliary application class."""
 import abc
 import logging
+from functools import cached_property, lru_cache
 from typing import Optional
 
 from packaging.version import Version
@@ -25,19 +26,48 @@ from cou.steps import ApplicationUpgradePlan, PreUpgradeStep
 from cou.utils.app_utils import set_require_osd_release_option
 from cou.utils.juju_utils import Unit
 from cou.utils.openstack import (
-    OPENSTACK_TO_TRACK_MAPPING,
+    OPENSTACK_TO_LATEST_CHANNEL,
+    TRACK_TO_LATEST_OPENSTACK,
     TRACK_TO_OPENSTACK_MAPPING,
+    VALID_TRACK_KEYS,
     OpenStackCodenameLookup,
     OpenStackRelease,
 )
 
 logger = logging.getLogger(__name__)
 
+REQUIRE_OSD_RELEASE_STEP_DESCRIPTION = (
+    "Ensure that the 'require-osd-release' option matches the 'ceph-osd' version"
+)
+NO_SUITABLE_CHANNEL_MESSAGE = (
+    "Cannot find a suitable '{charm}' charm channel for {codename} on series '{series}'. "
+    "Please take a look at the documentation: "
+    "https://docs.openstack.org/charm-guide/latest/project/charm-delivery.html"
+)
+CHARM_STORE_CODENAME_LOG_MESSAGE = (
+    "'Application %s' installed from charm store; assuming Ussuri as the underlying version."
+)
+
 
 @AppFactory.register_application(["vault", "ceph-fs", "ceph-radosgw"])
 class AuxiliaryApplication(OpenStackApplication):
     """Application for charms that can have multiple OpenStack releases for a workload."""
 
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_track_from_channel(charm_channel: str) -> str:
+        """Get the track from a given channel.
+
+        The result is cached, since the same channels are parsed repeatedly during the
+        analysis and the plan generation.
+
+        :param charm_channel: Charm channel. E.g: 3.8/stable
+        :type charm_channel: str
+        :return: The track from a channel. E.g: 3.8
+        :rtype: str
+        """
+        return OpenStackApplication._get_track_from_channel(charm_channel)
+
     def is_valid_track(self, charm_channel: str) -> bool:
         """Check if the channel track is valid.
 
@@ -54,16 +84,11 @@ class AuxiliaryApplication(OpenStackApplication):
             return True
 
         current_track = self._get_track_from_channel(charm_channel)
-        possible_tracks = OPENSTACK_TO_TRACK_MAPPING.get(
-            (self.charm, self.series, self.current_os_release.codename), []
-        )
-        return (
-            self.charm,
-            self.series,
-            current_track,
-        ) in TRACK_TO_OPENSTACK_MAPPING and len(possible_tracks) > 0
+        track_key = (self.charm, self.series, current_track)
+        os_release_key = (self.charm, self.series, self.current_os_release.codename)
+        return track_key in VALID_TRACK_KEYS and os_release_key in OPENSTACK_TO_LATEST_CHANNEL
 
-    @property
+    @cached_property
     def expected_current_channel(self) -> str:
         """Return the expected current channel.
 
@@ -73,12 +98,10 @@ class AuxiliaryApplication(OpenStackApplication):
         :return: The expected current channel of the application. E.g: "3.9/stable"
         :rtype: str
         """
-        *_, track = OPENSTACK_TO_TRACK_MAPPING[
+        return OPENSTACK_TO_LATEST_CHANNEL[
             (self.charm, self.series, self.current_os_release.codename)
         ]
 
-        return f"{track}/stable"
-
     def target_channel(self, target: OpenStackRelease) -> str:
         """Return the appropriate channel for the passed OpenStack target.
 
@@ -88,19 +111,16 @@ class AuxiliaryApplication(OpenStackApplication):
         :rtype: str
         :raises ApplicationError: When cannot find a track.
         """
-        tracks = OPENSTACK_TO_TRACK_MAPPING.get((self.charm, self.series, target.codename))
-        if tracks:
-            return f"{tracks[-1]}/stable"
-
-        raise ApplicationError(
-            (
-                f"Cannot find a suitable '{self.charm}' charm channel for {target.codename} "
-                f"on series '{self.series}'. Please take a look at the documentation: "
-                "https://docs.openstack.org/charm-guide/latest/project/charm-delivery.html"
-            )
-        )
+        try:
+            return OPENSTACK_TO_LATEST_CHANNEL[(self.charm, self.series, target.codename)]
+        except KeyError:
+            raise ApplicationError(
+                NO_SUITABLE_CHANNEL_MESSAGE.format(
+                    charm=self.charm, codename=target.codename, series=self.series
+                )
+            ) from None
 
-    @property
+    @cached_property
     def channel_codename(self) -> OpenStackRelease:
         """Identify the OpenStack release set in the charm channel.
 
@@ -113,18 +133,11 @@ class AuxiliaryApplication(OpenStackApplication):
                                   based on the track of the charm channel.
         """
         if self.is_from_charm_store:
-            logger.debug(
-                (
-                    "'Application %s' installed from charm store; assuming Ussuri as the "
-                    "underlying version."
-                ),
-                self.name,
-            )
+            logger.debug(CHARM_STORE_CODENAME_LOG_MESSAGE, self.name)
             return OpenStackRelease("ussuri")
 
         track: str = self._get_track_from_channel(self.channel)
-        compatible_os_releases = TRACK_TO_OPENSTACK_MAPPING[(self.charm, self.series, track)]
-        return max(compatible_os_releases)
+        return TRACK_TO_LATEST_OPENSTACK[(self.charm, self.series, track)]
 
     def generate_upgrade_plan(
         self,
@@ -198,9 +211,9 @@ class CephMon(AuxiliaryApplication):
         :return:  List of pre upgrade steps.
         :rtype: list[PreUpgradeStep]
         """
-        return super().pre_upgrade_steps(target, units) + [
-            self._get_change_require_osd_release_step()
-        ]
+        steps = super().pre_upgrade_steps(target, units)
+        steps.append(self._get_change_require_osd_release_step())
+        return steps
 
     def _get_change_require_osd_release_step(self) -> PreUpgradeStep:
         """Get the step to set correct value for require-osd-release option on ceph-mon.
@@ -211,9 +224,9 @@ class CephMon(AuxiliaryApplication):
         :return: Step to check and set correct value for require-osd-release
         :rtype: PreUpgradeStep
         """
-        ceph_mon_unit, *_ = self.units.values()
+        ceph_mon_unit = next(iter(self.units.values()))
         return PreUpgradeStep(
-            "Ensure that the 'require-osd-release' option matches the 'ceph-osd' version",
+            REQUIRE_OSD_RELEASE_STEP_DESCRIPTION,
             coro=set_require_osd_release_option(ceph_mon_unit.name, self.model),
         )
 
@@ -226,10 +239,12 @@ class OVN(AuxiliaryApplication):
         """Check OVN version to be implemented."""
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def _validate_ovn_support(version: str) -> None:
         """Validate COU OVN support.
 
         COU does not support upgrade clouds with OVN version lower than 22.03.
+        Successful validations are cached, since OVN units share the same versions.
 
         :param version: Version of the OVN.
         :type version: str
@@ -289,8 +304,8 @@ class OVNPrincipal(OVN):
 
         :raises ApplicationError: When workload version is lower than 22.03.0.
         """
-        for unit in self.units.values():
-            OVNPrincipal._validate_ovn_support(unit.workload_version)
+        for workload_version in {unit.workload_version for unit in self.units.values()}:
+            OVNPrincipal._validate_ovn_support(workload_version)
 
 
 @AppFactory.register_application(["mysql-innodb-cluster"])
@@ -299,7 +314,7 @@ class MysqlInnodbCluster(AuxiliaryApplication):
 
     # NOTE(agileshaw): holding 'mysql-server-core-8.0' package prevents undesired
     # mysqld processes from restarting, which lead to outages
-    packages_to_hold: Optional[list] = ["mysql-server-core-8.0"]
+    packages_to_hold: Optional[tuple[str, ...]] = ("mysql-server-core-8.0",)
     wait_timeout = LONG_IDLE_TIMEOUT
 
 
@@ -64,7 +64,7 @@ class OpenStackApplication(Application):
                                          OpenStack versions.
     """
 
-    packages_to_hold: Optional[list] = field(default=None, init=False)
+    packages_to_hold: Optional[tuple[str, ...]] = field(default=None, init=False)
     wait_timeout: int = field(default=STANDARD_IDLE_TIMEOUT, init=False)
     wait_for_model: bool = field(default=False, init=False)  # waiting only for application itself
 
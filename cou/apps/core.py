@@ -71,7 +71,9 @@ class NovaCompute(OpenStackApplication):
         :return: List of pre upgrade steps.
         :rtype: list[PreUpgradeStep]
         """
-        return self._get_disable_scheduler_step(units) + super().pre_upgrade_steps(target, units)
+        steps = self._get_disable_scheduler_step(units)
+        steps.extend(super().pre_upgrade_steps(target, units))
+        return steps
 
     def upgrade_steps(
         self, target: OpenStackRelease, units: Optional[list[Unit]], force: bool
@@ -106,7 +108,9 @@ class NovaCompute(OpenStackApplication):
         :return: List of post upgrade steps.
         :rtype: list[PostUpgradeStep]
         """
-        return self._get_enable_scheduler_step(units) + super().post_upgrade_steps(target, units)
+        steps = self._get_enable_scheduler_step(units)
+        steps.extend(super().post_upgrade_steps(target, units))
+        return steps
 
     def _get_unit_upgrade_steps(self, unit: Unit, force: bool) -> UnitUpgradeStep:
         """Get the upgrade steps for a single unit.
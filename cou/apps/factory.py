@@ -93,8 +93,7 @@ class AppFactory:
         def decorator(  # pylint: disable=W9011
             application: type[OpenStackApplication],
         ) -> type[OpenStackApplication]:
-            for charm in charms:
-                cls.charms[charm] = application
+            cls.charms.update(dict.fromkeys(charms, application))
             return application
 
         return decorator
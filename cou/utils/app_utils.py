@@ -24,15 +24,17 @@ from cou.utils.openstack import CEPH_RELEASES
 logger = logging.getLogger(__name__)
 
 
-async def upgrade_packages(unit: str, model: Model, packages_to_hold: Optional[list]) -> None:
+async def upgrade_packages(
+    unit: str, model: Model, packages_to_hold: Optional[tuple[str, ...]]
+) -> None:
     """Run package updates and upgrades on each unit of an Application.
 
     :param unit: Unit name where the package upgrade runs on.
     :type unit: str
     :param model: Model object
     :type model: Model
-    :param packages_to_hold: A list of packages to put on hold during package upgrade.
-    :type packages_to_hold: Optional[list]
+    :param packages_to_hold: Packages to put on hold during package upgrade.
+    :type packages_to_hold: Optional[tuple[str, ...]]
     :raises CommandRunFailed: When a command fails to run.
     """
     dpkg_opts = "-o Dpkg::Options::=--force-confnew -o Dpkg::Options::=--force-confdef"
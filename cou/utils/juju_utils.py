@@ -21,6 +21,7 @@ import logging
 import os
 from dataclasses import dataclass
 from datetime import datetime
+from functools import cached_property
 from typing import Any, Callable, Optional
 
 from juju.action import Action
@@ -179,7 +180,7 @@ class Application:
         """
         return bool(self.subordinate_to)
 
-    @property
+    @cached_property
     def is_from_charm_store(self) -> bool:
         """Check if application comes from charm store.
 
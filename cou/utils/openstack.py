@@ -18,6 +18,7 @@ from __future__ import annotations
 import csv
 import encodings
 import logging
+import sys
 from collections import OrderedDict, defaultdict, namedtuple
 from dataclasses import dataclass
 from functools import total_ordering
@@ -169,6 +170,9 @@ class OpenStackRelease:
     alphanumerically ordered.  e.g. OpenStack releases AFTER the z-wrap.
     """
 
+    # NOTE: releases are created for every unit, channel and target, so avoid per-instance dict
+    __slots__ = ("_codename", "index")
+
     openstack_codenames = list(OPENSTACK_CODENAMES.keys())
     openstack_release_date = list(OPENSTACK_CODENAMES.values())
 
@@ -451,15 +455,26 @@ def _generate_track_mapping() -> tuple[
     ) as csv_file:
         csv_reader = csv.DictReader(csv_file, delimiter=",")
         for row in csv_reader:
-            track_key = TrackKeys(
-                charm=row["charm"], series=row["series"], os_release=row["os_release"]
-            )
-            os_release_key = OSReleaseKeys(
-                charm=row["charm"], series=row["series"], track=row["track"]
+            # NOTE: the same charm, series, release and track strings repeat across rows,
+            # so intern them to share a single object for all the keys that use them
+            charm, series, os_release, track = (
+                sys.intern(row[column]) for column in ("charm", "series", "os_release", "track")
             )
-            track_mapping[track_key].append(row["track"])
-            os_release_mapping[os_release_key].append(OpenStackRelease(row["os_release"]))
+            track_key = TrackKeys(charm=charm, series=series, os_release=os_release)
+            os_release_key = OSReleaseKeys(charm=charm, series=series, track=track)
+            track_mapping[track_key].append(track)
+            os_release_mapping[os_release_key].append(OpenStackRelease(os_release))
     return track_mapping, os_release_mapping
 
 
 OPENSTACK_TO_TRACK_MAPPING, TRACK_TO_OPENSTACK_MAPPING = _generate_track_mapping()
+# tracks known for each charm and series. E.g: ("vault", "focal", "1.7")
+VALID_TRACK_KEYS: frozenset[tuple[str, str, str]] = frozenset(TRACK_TO_OPENSTACK_MAPPING)
+# latest channel for each OpenStack release, computed once at import. E.g: "3.9/stable"
+OPENSTACK_TO_LATEST_CHANNEL: dict[tuple[str, str, str], str] = {
+    key: f"{tracks[-1]}/stable" for key, tracks in OPENSTACK_TO_TRACK_MAPPING.items()
+}
+# latest compatible OpenStack release for each track, computed once at import
+TRACK_TO_LATEST_OPENSTACK: dict[tuple[str, str, str], OpenStackRelease] = {
+    key: max(os_releases) for key, os_releases in TRACK_TO_OPENSTACK_MAPPING.items()
+}
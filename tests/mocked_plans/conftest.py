@@ -12,10 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from collections.abc import Awaitable, Callable
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
+from cou.steps.analyze import Analysis
 from cou.utils.juju_utils import Model
 from tests.mocked_plans.utils import get_sample_plan
 
@@ -35,3 +38,31 @@ def sample_plans() -> dict[str, tuple[Model, str]]:
     yield {
         sample_file.name: get_sample_plan(sample_file) for sample_file in directory.glob("*.yaml")
     }
+
+
+@pytest.fixture(scope="module")
+def sample_analysis(sample_plans) -> Callable[[str], Awaitable[Analysis]]:
+    """Fixture that returns a coroutine function to get the analysis of a sample plan.
+
+    The coroutine function takes the filename of a sample plan and returns
+    the cou.steps.analyze.Analysis object created from its model. Each
+    analysis is created on its first request and then shared by all tests
+    of the module generating plans from the same model.
+    """
+    analyses: dict[str, Analysis] = {}
+
+    async def get_analysis(name: str) -> Analysis:
+        if name not in analyses:
+            model, _ = sample_plans[name]
+            analyses[name] = await Analysis.create(model)
+
+        return analyses[name]
+
+    yield get_analysis
+
+
+@pytest.fixture
+def mock_instance_count():
+    """Fixture that mocks the instance count of nova-compute units, all hypervisors are empty."""
+    with patch("cou.utils.nova_compute.get_instance_count", return_value=0) as mock:
+        yield mock
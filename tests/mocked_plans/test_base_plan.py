@@ -12,23 +12,20 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 """Test all sample plans."""
-from unittest.mock import patch
-
 import pytest
 
 from cou.commands import CLIargs
-from cou.steps.analyze import Analysis
 from cou.steps.plan import generate_plan
 
 
 @pytest.mark.asyncio
-@patch("cou.utils.nova_compute.get_instance_count", return_value=0)
-async def test_base_plan(_, sample_plans):
+@pytest.mark.usefixtures("mock_instance_count")
+async def test_base_plan(sample_plans, sample_analysis):
     """Testing the base plans."""
     args = CLIargs("plan", auto_approve=True)
-    model, exp_plan = sample_plans["base.yaml"]
+    _, exp_plan = sample_plans["base.yaml"]
 
-    analysis_results = await Analysis.create(model)
+    analysis_results = await sample_analysis("base.yaml")
     plan = await generate_plan(analysis_results, args)
 
     assert str(plan) == exp_plan
@@ -12,7 +12,7 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 """Auxiliary application class."""
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, PropertyMock, patch
 
 import pytest
 
@@ -24,6 +24,7 @@ from cou.apps.auxiliary import (
     OVNPrincipal,
     RabbitMQServer,
 )
+from cou.apps.base import OpenStackApplication
 from cou.apps.core import NovaCompute
 from cou.exceptions import ApplicationError, HaltUpgradePlanGeneration
 from cou.steps import (
@@ -107,6 +108,76 @@ def test_auxiliary_app_cs(model):
     assert app.current_os_release == "yoga"
 
 
+@pytest.fixture
+def clear_track_cache():
+    """Clear the cached tracks of auxiliary channels before and after the test."""
+    AuxiliaryApplication._get_track_from_channel.cache_clear()
+    yield
+    AuxiliaryApplication._get_track_from_channel.cache_clear()
+
+
+@pytest.mark.parametrize(
+    "channel", ["3.8/stable", "3.9/edge", "22.03/candidate/branch", "latest", "stable", ""]
+)
+@pytest.mark.usefixtures("clear_track_cache")
+def test_auxiliary_get_track_from_channel(channel):
+    """Test that auxiliary apps parse the track as any other OpenStack application."""
+    exp_track = OpenStackApplication._get_track_from_channel(channel)
+
+    assert AuxiliaryApplication._get_track_from_channel(channel) == exp_track
+
+
+@pytest.mark.usefixtures("clear_track_cache")
+def test_auxiliary_get_track_from_channel_cached():
+    """Test that each channel is parsed only once."""
+    with patch.object(
+        OpenStackApplication,
+        "_get_track_from_channel",
+        wraps=OpenStackApplication._get_track_from_channel,
+    ) as mock_get_track_from_channel:
+        assert AuxiliaryApplication._get_track_from_channel("3.8/stable") == "3.8"
+        assert AuxiliaryApplication._get_track_from_channel("3.8/stable") == "3.8"
+        assert AuxiliaryApplication._get_track_from_channel("3.9/edge") == "3.9"
+
+    assert mock_get_track_from_channel.call_count == 2
+    mock_get_track_from_channel.assert_any_call("3.8/stable")
+    mock_get_track_from_channel.assert_any_call("3.9/edge")
+
+
+@patch("cou.apps.auxiliary.TRACK_TO_LATEST_OPENSTACK")
+def test_auxiliary_app_cached_channels(mock_track_to_latest_openstack, model):
+    """Test that the channel codename and the expected channel are computed only once."""
+    mock_track_to_latest_openstack.__getitem__.return_value = OpenStackRelease("yoga")
+    app = AuxiliaryApplication(
+        name="vault",
+        can_upgrade_to="",
+        charm="vault",
+        channel="1.7/stable",
+        config={},
+        machines={},
+        model=model,
+        origin="ch",
+        series="focal",
+        subordinate_to=[],
+        units={},
+        workload_version="1.7",
+    )
+
+    with patch(
+        "cou.apps.base.OpenStackApplication.current_os_release", new_callable=PropertyMock
+    ) as mock_current_os_release:
+        mock_current_os_release.return_value = OpenStackRelease("ussuri")
+        assert app.expected_current_channel == "1.7/stable"
+        assert app.expected_current_channel == "1.7/stable"
+
+    mock_current_os_release.assert_called_once_with()
+
+    assert app.channel_codename == "yoga"
+    assert app.channel_codename == "yoga"
+
+    mock_track_to_latest_openstack.__getitem__.assert_called_once_with(("vault", "focal", "1.7"))
+
+
 def test_auxiliary_upgrade_plan_ussuri_to_victoria_change_channel(model):
     """Test auxiliary upgrade plan from Ussuri to Victoria with change of channel."""
     target = OpenStackRelease("victoria")
@@ -805,6 +876,40 @@ def test_ovn_workload_ver_lower_than_22_principal(model):
         app.generate_upgrade_plan(target, False)
 
 
+@patch("cou.apps.auxiliary.OVNPrincipal._validate_ovn_support")
+def test_ovn_principal_check_ovn_support_distinct_versions(mock_validate_ovn_support, model):
+    """Test that the OVNPrincipal validates each workload version only once."""
+    charm = "ovn-central"
+    machines = {f"{i}": MagicMock(spec_set=Machine) for i in range(3)}
+    app = OVNPrincipal(
+        name=charm,
+        can_upgrade_to="",
+        charm=charm,
+        channel="22.03/stable",
+        config={},
+        machines=machines,
+        model=model,
+        origin="ch",
+        series="focal",
+        subordinate_to=[],
+        units={
+            f"{charm}/{i}": Unit(
+                name=f"{charm}/{i}",
+                workload_version=workload_version,
+                machine=machines[f"{i}"],
+            )
+            for i, workload_version in enumerate(["22.03", "22.03", "22.03.2"])
+        },
+        workload_version="22.03",
+    )
+
+    app._check_ovn_support()
+
+    assert mock_validate_ovn_support.call_count == 2
+    mock_validate_ovn_support.assert_any_call("22.03")
+    mock_validate_ovn_support.assert_any_call("22.03.2")
+
+
 def test_ovn_version_pinning_principal(model):
     """Test the OVNPrincipal when enable-version-pinning is set to True."""
     target = OpenStackRelease("victoria")
@@ -1045,7 +1150,7 @@ def test_mysql_innodb_cluster_upgrade(model):
     upgrade_packages.add_steps(
         UnitUpgradeStep(
             description=f"Upgrade software packages on unit '{unit.name}'",
-            coro=app_utils.upgrade_packages(unit.name, model, ["mysql-server-core-8.0"]),
+            coro=app_utils.upgrade_packages(unit.name, model, ("mysql-server-core-8.0",)),
         )
         for unit in app.units.values()
     )
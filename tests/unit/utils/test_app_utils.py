@@ -56,7 +56,7 @@ async def test_application_upgrade_packages_with_hold(model):
 
     for unit in units:
         await app_utils.upgrade_packages(
-            unit=unit, model=model, packages_to_hold=["package1", "package2"]
+            unit=unit, model=model, packages_to_hold=("package1", "package2")
         )
 
     dpkg_opts = "-o Dpkg::Options::=--force-confnew -o Dpkg::Options::=--force-confdef"
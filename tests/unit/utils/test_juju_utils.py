@@ -725,3 +725,28 @@ async def test_get_applications(mock_get_machines, mock_get_status, mocked_model
     assert len(apps["app2"].machines) == 1
     assert len(apps["app3"].machines) == 1
     assert len(apps["app4"].machines) == 1
+
+
+@pytest.mark.parametrize("origin, exp_result", [("cs", True), ("ch", False), ("", False)])
+def test_application_is_from_charm_store(origin, exp_result):
+    """Test Application is_from_charm_store property."""
+    app = juju_utils.Application(
+        name="app",
+        can_upgrade_to="",
+        charm="app",
+        channel="stable",
+        config={},
+        machines={},
+        model=MagicMock(),
+        origin=origin,
+        series="focal",
+        subordinate_to=[],
+        units={},
+        workload_version="1",
+    )
+
+    assert app.is_from_charm_store is exp_result
+
+    # the origin is not read again after the first access
+    object.__setattr__(app, "origin", "ch" if exp_result else "cs")
+    assert app.is_from_charm_store is exp_result
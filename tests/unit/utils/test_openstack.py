@@ -11,11 +11,16 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import sys
+
 import pytest
 
 from cou.utils.openstack import (
+    OPENSTACK_TO_LATEST_CHANNEL,
     OPENSTACK_TO_TRACK_MAPPING,
+    TRACK_TO_LATEST_OPENSTACK,
     TRACK_TO_OPENSTACK_MAPPING,
+    VALID_TRACK_KEYS,
     OpenStackCodenameLookup,
     OpenStackRelease,
     VersionRange,
@@ -227,6 +232,13 @@ def test_openstack_release_setter_by_date():
     assert openstack_release.date == "2023.1"
 
 
+def test_openstack_release_slots():
+    openstack_release = OpenStackRelease("wallaby")
+    assert not hasattr(openstack_release, "__dict__")
+    with pytest.raises(AttributeError):
+        openstack_release.foo = "bar"
+
+
 @pytest.mark.parametrize("os_release", ["victoria", "wallaby"])
 def test_compare_openstack_repr_str(os_release):
     os_compare = OpenStackRelease(os_release)
@@ -326,6 +338,41 @@ def test_openstack_to_track(charm, series, os_release, exp_result):
     assert OPENSTACK_TO_TRACK_MAPPING.get((charm, series, os_release)) == exp_result
 
 
+@pytest.mark.parametrize(
+    "charm, series, os_release, exp_result",
+    [
+        ("ceph-mon", "focal", "ussuri", "octopus/stable"),
+        ("ovn-central", "focal", "yoga", "22.03/stable"),
+        ("hacluster", "focal", "yoga", "2.4/stable"),
+        ("rabbitmq-server", "focal", "ussuri", "3.9/stable"),
+        ("vault", "jammy", "zed", "1.8/stable"),
+        ("vault", "bionic", "zed", None),  # release not mapped
+    ],
+)
+def test_openstack_to_latest_channel(charm, series, os_release, exp_result):
+    assert OPENSTACK_TO_LATEST_CHANNEL.get((charm, series, os_release)) == exp_result
+
+
+@pytest.mark.parametrize(
+    "charm, series, track, exp_result",
+    [
+        ("ceph-mon", "focal", "octopus", True),
+        ("ovn-central", "jammy", "22.09", True),
+        ("vault", "jammy", "1.8", True),
+        ("vault", "jammy", "1.7", False),  # track not mapped
+        ("my-service", "jammy", "1.8", False),  # charm not mapped
+    ],
+)
+def test_valid_track_keys(charm, series, track, exp_result):
+    assert ((charm, series, track) in VALID_TRACK_KEYS) is exp_result
+
+
+def test_track_mapping_keys_interned():
+    # the same strings are shared by all the keys of the track mappings
+    for key in [*OPENSTACK_TO_TRACK_MAPPING, *TRACK_TO_OPENSTACK_MAPPING]:
+        assert all(value is sys.intern(value) for value in key)
+
+
 @pytest.mark.parametrize(
     "series, charm, track, exp_result",
     [
@@ -461,6 +508,21 @@ def test_track_to_openstack(charm, series, track, exp_result):
     assert TRACK_TO_OPENSTACK_MAPPING.get((charm, series, track)) == exp_result
 
 
+@pytest.mark.parametrize(
+    "charm, series, track, exp_result",
+    [
+        ("ceph-mon", "focal", "octopus", "victoria"),
+        ("ceph-mon", "focal", "quincy", "yoga"),
+        ("ceph-mon", "jammy", "quincy", "antelope"),
+        ("rabbitmq-server", "focal", "3.8", "yoga"),
+        ("vault", "jammy", "1.8", "antelope"),
+        ("vault", "jammy", "1.7", None),  # track not mapped
+    ],
+)
+def test_track_to_latest_openstack(charm, series, track, exp_result):
+    assert TRACK_TO_LATEST_OPENSTACK.get((charm, series, track)) == exp_result
+
+
 @pytest.mark.parametrize(
     "charm, exp_result",
     [